@@ -1,16 +1,33 @@
 import sys
 import os
+import io
 import re
+import posixpath
 import json
+import queue
+import hashlib
+import sqlite3
 import zipfile
 from datetime import datetime
-from threading import Event
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from threading import Event, Thread
+from concurrent.futures import (
+    ThreadPoolExecutor,
+    ProcessPoolExecutor,
+    FIRST_COMPLETED,
+    wait,
+)
+from contextlib import closing, nullcontext
+from functools import lru_cache
+from itertools import chain, islice, product
+from string import ascii_uppercase
+from multiprocessing import freeze_support
 import xml.etree.ElementTree as ET
 import subprocess
 
-from openpyxl import Workbook
-from openpyxl.styles import Font, Alignment
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick is optional, fall back to a regex
+    ahocorasick = None
 from PyQt5.QtWidgets import (
     QApplication,
     QWidget,
@@ -26,7 +43,7 @@ from PyQt5.QtWidgets import (
     QTableWidgetItem,
     QCheckBox,
 )
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
+from PyQt5.QtCore import Qt, QThread, QTimer, pyqtSignal
 from PyQt5.QtGui import QColor
 
 
@@ -36,16 +53,113 @@ def load_config(config_path="config.json"):
         return json.load(f)
 
 
-CONFIG = load_config()
+def build_text_automaton(texts):
+    if ahocorasick is None or not texts:
+        return None
+    automaton = ahocorasick.Automaton()
+    for text in texts:
+        automaton.add_word(text, text)
+    automaton.make_automaton()
+    return automaton
+
+
+@lru_cache(maxsize=4096)
+def get_category_prefixes(dir_path):
+    # Files in one folder share the same category folders; cleared whenever
+    # a config is applied.
+    parts = os.path.normpath(dir_path).split(os.sep)
+    return tuple(
+        (folder, prefix)
+        for folder, prefix in CATEGORY_PREFIX_MAP.items()
+        if folder in parts
+    )
+
+
+def apply_config(config):
+    global CONFIG, CATEGORY_PREFIX_MAP, INVALID_SHEETS, REQUIRED_SHEETS
+    global EXCEL_EXTENSIONS, EXCEL_EXT_SET, INVALID_CHARS, INVALID_TEXT
+    global VN_DELETE_TABLE, INVALID_TEXT_AUTOMATON, INVALID_TEXT_RE
+    global SYSDATE_COLUMNS, SCAN_LIMITS, CONFIG_HASH
+
+    CONFIG = config
+    CATEGORY_PREFIX_MAP = config["category_prefix_map"]
+    INVALID_SHEETS = set(config["invalid_sheets"])
+    REQUIRED_SHEETS = set(config["required_sheets"])
+    EXCEL_EXTENSIONS = tuple(config["excel_extensions"])
+    EXCEL_EXT_SET = frozenset(ext.lower() for ext in EXCEL_EXTENSIONS)
+    INVALID_CHARS = set(config["invalid_chars"])
+    INVALID_TEXT = set(config["invalid_text"])
+    VN_DELETE_TABLE = str.maketrans("", "", "".join(INVALID_CHARS))
+    INVALID_TEXT_AUTOMATON = build_text_automaton(INVALID_TEXT)
+    # Used when pyahocorasick is not installed
+    INVALID_TEXT_RE = (
+        re.compile("|".join(re.escape(text) for text in INVALID_TEXT))
+        if INVALID_TEXT
+        else None
+    )
+    SYSDATE_COLUMNS = (
+        config["sysdate_check_columns"]["start"],
+        config["sysdate_check_columns"]["end"],
+    )
+    SCAN_LIMITS = {"max_rows": 1000, "empty_limit": 10, **config.get("scan_limits", {})}
+    CONFIG_HASH = hash_json(config)
+    get_category_prefixes.cache_clear()
+
+
+def hash_json(data):
+    return hashlib.blake2b(
+        json.dumps(data, sort_keys=True).encode(), digest_size=16
+    ).hexdigest()
+
+
+def reload_config_if_changed(config_path="config.json"):
+    # config.json is only re-read (and the tables above rebuilt) when it was
+    # modified since the last load.
+    global CONFIG_MTIME
+    mtime = os.stat(config_path).st_mtime_ns
+    if mtime == CONFIG_MTIME:
+        return False
+    apply_config(load_config(config_path))
+    CONFIG_MTIME = mtime
+    return True
+
+
+def init_worker_process(config):
+    # Worker processes get the config of the run that started them, not
+    # whatever config.json holds when they import this module.
+    apply_config(config)
+
+
+CONFIG_MTIME = None
+reload_config_if_changed()
 
 # Constants
-CATEGORY_PREFIX_MAP = CONFIG["category_prefix_map"]
-INVALID_SHEETS = set(CONFIG["invalid_sheets"])
-REQUIRED_SHEETS = set(CONFIG["required_sheets"])
-EXCEL_EXTENSIONS = tuple(CONFIG["excel_extensions"])
-INVALID_CHARS = set(CONFIG["invalid_chars"])
-INVALID_TEXT = set(CONFIG["invalid_text"])
+PROCESS_POOL_MIN_FILES = 4
+CELL_REF_RE = re.compile(r"([A-Z]+)(\d+)")
+SYSDATE_DETECT_RE = re.compile(r"SYSDATE", re.IGNORECASE)
+SYSDATE_VALID_RE = re.compile(
+    r"(?:^|[^A-Za-z])SYSDATE\s*\(\s*\)(?:$|[^A-Za-z])", re.IGNORECASE
+)
+TEXT_CELL_TYPES = frozenset(("s", "str"))  # shared and formula strings
+# Integer <v> contents; for t="s" cells these are shared string indexes
+CELL_VALUE_RE = re.compile(rb"<(?:\w+:)?v>(\d+)</")
+FORMULA_STRING_RE = re.compile(rb"""\st=["']str["']""")
+SHARED_STRINGS_CACHE = {}
+SHARED_STRINGS_CACHE_SIZE = 256
+RESULT_CACHE_PATH = os.path.join(
+    os.environ.get("LOCALAPPDATA") or os.path.expanduser("~/.cache"),
+    "excel-checker",
+    "results.db",
+)
+# Bump whenever the checks change what they report for the same file, or the
+# cache key or schema changes; a cache of any other version is cleared
+CACHE_VERSION = 2
 NS_MAIN = {"a": "http://schemas.openxmlformats.org/spreadsheetml/2006/main"}
+TAG_ROW = f"{{{NS_MAIN['a']}}}row"
+TAG_C = f"{{{NS_MAIN['a']}}}c"
+TAG_V = f"{{{NS_MAIN['a']}}}v"
+NS_DOC_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+NS_PKG_REL = "http://schemas.openxmlformats.org/package/2006/relationships"
 NS_DRAWING = {
     "xdr": "http://schemas.openxmlformats.org/drawingml/2006/spreadsheetDrawing",
     "a": "http://schemas.openxmlformats.org/drawingml/2006/main",
@@ -53,121 +167,336 @@ NS_DRAWING = {
 
 
 # ==================== UTILITY FUNCTIONS ====================
+# Excel has at most 16384 (XFD) columns: A-Z, then AA-ZZ, then AAA-XFD
+COL_LETTERS = tuple(
+    islice(
+        chain(
+            ascii_uppercase,
+            map("".join, product(ascii_uppercase, repeat=2)),
+            map("".join, product(ascii_uppercase, repeat=3)),
+        ),
+        16384,
+    )
+)
+COL_NUMBERS = {letter: num for num, letter in enumerate(COL_LETTERS, 1)}
+# テスト項目 keeps its '確認' header somewhere in columns 50-99
+STATUS_HEADER_COLS = frozenset(COL_LETTERS[49:99])
+
+
 def col_num_to_letter(col_num):
-    result = ""
-    while col_num:
-        col_num, rem = divmod(col_num - 1, 26)
-        result = chr(65 + rem) + result
-    return result
+    return COL_LETTERS[col_num - 1]
 
 
-def find_excel_files_recursive(folder_path):
-    return [
-        os.path.join(root, file)
-        for root, _, files in os.walk(folder_path)
-        for file in files
-        if not file.lower().startswith("~$") and file.lower().endswith(EXCEL_EXTENSIONS)
-    ]
+def iter_excel_files(folder_path):
+    stack = [folder_path]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        # Like os.walk, entries or directories that cannot be read are
+        # skipped rather than ending the scan.
+        with it:
+            try:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                            continue
+                        if not (
+                            os.path.splitext(entry.name)[1].lower() in EXCEL_EXT_SET
+                            and not entry.name.startswith("~$")
+                            and entry.is_file()
+                        ):
+                            continue
+                    except OSError:
+                        continue
+                    yield entry.path
+            except OSError:
+                pass
+
+
+def open_result_cache(cache_path=RESULT_CACHE_PATH):
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    conn = sqlite3.connect(cache_path)
+    try:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        if conn.execute("PRAGMA user_version").fetchone()[0] != CACHE_VERSION:
+            migrate_result_cache(conn)
+    except sqlite3.Error:
+        conn.close()
+        raise
+    return conn
+
+
+def migrate_result_cache(conn):
+    # Rows written by another version can never be hit again
+    with conn:
+        conn.execute("DROP TABLE IF EXISTS file_results")
+        conn.execute(
+            "CREATE TABLE file_results "
+            "(key TEXT PRIMARY KEY, path TEXT, status TEXT, error TEXT)"
+        )
+        conn.execute("CREATE INDEX file_results_path ON file_results (path)")
+        conn.execute(f"PRAGMA user_version = {CACHE_VERSION}")
+
+
+def get_cache_key(file_path, options_hash):
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return None
+    key = (
+        f"{os.path.abspath(file_path)}|{st.st_mtime_ns}|{st.st_size}"
+        f"|{options_hash}|{CONFIG_HASH}|{CACHE_VERSION}"
+    )
+    return hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+
+
+def get_cached_result(cache, cache_key):
+    return cache.execute(
+        "SELECT status, error FROM file_results WHERE key = ?", (cache_key,)
+    ).fetchone()
+
+
+def store_cached_result(cache, cache_key, file_path, status, error_msg):
+    # Keep one row per file; rows for older versions of it are never hit again
+    path = os.path.abspath(file_path)
+    with cache:
+        cache.execute("DELETE FROM file_results WHERE path = ?", (path,))
+        cache.execute(
+            "INSERT INTO file_results (key, path, status, error) VALUES (?, ?, ?, ?)",
+            (cache_key, path, status, error_msg),
+        )
 
 
 def get_shared_strings(zip_ref):
     try:
-        with zip_ref.open("xl/sharedStrings.xml") as f:
-            root = ET.parse(f).getroot()
-            return [
-                "".join(t.text for t in si.findall(".//a:t", NS_MAIN) if t.text)
-                for si in root.findall("a:si", NS_MAIN)
-            ]
+        info = zip_ref.getinfo("xl/sharedStrings.xml")
     except KeyError:
-        return []
+        return ()
 
+    # Workbooks made from the same template often carry an identical strings
+    # part; the CRC and size from the zip directory identify it without
+    # decompressing anything.
+    key = (info.CRC, info.file_size)
+    if key in SHARED_STRINGS_CACHE:
+        return SHARED_STRINGS_CACHE[key]
 
-def get_sheet_names(zip_ref):
-    with zip_ref.open("xl/workbook.xml") as f:
+    with zip_ref.open(info) as f:
         root = ET.parse(f).getroot()
-        return [sheet.attrib["name"] for sheet in root.findall(".//a:sheet", NS_MAIN)]
+        shared_strings = tuple(
+            "".join(t.text for t in si.findall(".//a:t", NS_MAIN) if t.text)
+            for si in root.findall("a:si", NS_MAIN)
+        )
+    if len(SHARED_STRINGS_CACHE) >= SHARED_STRINGS_CACHE_SIZE:
+        SHARED_STRINGS_CACHE.pop(next(iter(SHARED_STRINGS_CACHE)), None)
+    SHARED_STRINGS_CACHE[key] = shared_strings
+    return shared_strings
+
+
+def get_sheet_parts(zip_ref):
+    # Map sheet names (in workbook order) to their part names through the
+    # workbook relationships, so sheet N is not assumed to be sheetN.xml.
+    try:
+        with zip_ref.open("xl/_rels/workbook.xml.rels") as f:
+            targets = {
+                elem.get("Id"): elem.get("Target")
+                for _, elem in ET.iterparse(f)
+                if elem.tag == f"{{{NS_PKG_REL}}}Relationship"
+            }
+    except KeyError:
+        targets = {}
+
+    sheet_parts = {}
+    with zip_ref.open("xl/workbook.xml") as f:
+        for _, elem in ET.iterparse(f):
+            if elem.tag == f"{{{NS_MAIN['a']}}}sheet":
+                target = targets.get(elem.get(f"{{{NS_DOC_REL}}}id"))
+                if target and target.startswith("/"):
+                    part = target[1:]
+                elif target:
+                    part = posixpath.normpath(posixpath.join("xl", target))
+                else:
+                    part = f"xl/worksheets/sheet{len(sheet_parts) + 1}.xml"
+                sheet_parts[elem.get("name")] = part
+                elem.clear()
+            elif elem.tag == f"{{{NS_MAIN['a']}}}sheets":
+                # Defined names, calc settings etc. follow; none are used
+                break
+    return sheet_parts
 
 
 def parse_cell_value(cell, shared_strings):
     value = None
-    v = cell.find("a:v", NS_MAIN)
+    # A fully qualified tag lets find() skip the ElementPath prefix parsing
+    v = cell.find(TAG_V)
     if v is not None:
         value = v.text
-        if cell.attrib.get("t") == "s" and value and value.isdigit():
+        if cell.get("t") == "s" and value and value.isdigit():
             value = shared_strings[int(value)]
     return value
 
 
-def extract_cells_from_sheet(zip_ref, sheet_file, shared_strings):
-    with zip_ref.open(sheet_file) as f:
-        root = ET.parse(f).getroot()
-        return {
-            cell.attrib.get("r"): parse_cell_value(cell, shared_strings)
-            for cell in root.iter(
-                "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}c"
-            )
-        }
+def extract_cells_from_sheet(sheet_xml, shared_strings):
+    root = ET.fromstring(sheet_xml)
+    # Only the text checks read this map, so numbers, booleans, errors and
+    # the styled empty cells that make up most of a report sheet are left out.
+    return {
+        cell.get("r"): parse_cell_value(cell, shared_strings)
+        for cell in root.iter(TAG_C)
+        if cell.get("t") in TEXT_CELL_TYPES
+    }
+
+
+def iter_sheet_cells(sheet_xml, shared_strings):
+    for _, elem in ET.iterparse(io.BytesIO(sheet_xml)):
+        if elem.tag == TAG_ROW:
+            for cell in elem.iter(TAG_C):
+                if cell.get("t") in TEXT_CELL_TYPES:
+                    yield cell.get("r"), parse_cell_value(cell, shared_strings)
+            elem.clear()
+
+
+def iter_sheet_rows(zip_ref, sheet_file, read_sheets=None):
+    # Stream <row> elements so callers can stop reading early; each row is
+    # cleared once the caller moves on to the next one. Sheets the content
+    # checks already read are parsed from memory instead of the zip.
+    if read_sheets and sheet_file in read_sheets:
+        source = io.BytesIO(read_sheets[sheet_file])
+    else:
+        source = zip_ref.open(sheet_file)
+    with source as f:
+        row_num = 0
+        for _, elem in ET.iterparse(f):
+            if elem.tag == TAG_ROW:
+                row_num = int(elem.get("r") or row_num + 1)
+                yield row_num, elem
+                elem.clear()
+
+
+def get_row_values(row, shared_strings, columns):
+    values = {}
+    for cell in row.iter(TAG_C):
+        # Styled but empty cells have no children and read as None anyway
+        if not len(cell):
+            continue
+        col = (cell.get("r") or "").rstrip("0123456789")
+        if col in columns:
+            values[col] = parse_cell_value(cell, shared_strings)
+    return values
+
+
+def find_confirm_column(headers):
+    for row_num in (3, 4):
+        cols = [col for col, val in headers.get(row_num, {}).items() if val == "確認"]
+        if cols:
+            return min(cols, key=COL_NUMBERS.get)
+    return None
 
 
-def check_confirm_by(zip_ref, shared_strings, sheet_names):
+class CheckFailure(str):
+    # Message of a check that raised instead of reaching a verdict; the cause
+    # may be transient (file still being written, network share dropped)
+    pass
+
+
+def check_confirm_by(zip_ref, shared_strings, sheet_parts, read_sheets=None):
     try:
-        if "表紙" not in sheet_names:
+        if "表紙" not in sheet_parts:
             return "Missing required sheet: '表紙'"
-        idx = sheet_names.index("表紙") + 1
-        cells = extract_cells_from_sheet(
-            zip_ref, f"xl/worksheets/sheet{idx}.xml", shared_strings
-        )
-
-        for ref, val in cells.items():
-            if val == "確認":
-                match = re.match(r"([A-Z]+)(\d+)", ref)
+        sheet_file = sheet_parts["表紙"]
+
+        # With no "確認" shared string, only a formula result could hold one
+        if "確認" not in shared_strings:
+            sheet_xml = (read_sheets or {}).get(sheet_file) or zip_ref.read(sheet_file)
+            if not FORMULA_STRING_RE.search(sheet_xml):
+                return None
+
+        # Stream the sheet and stop at the first "確認" whose cell below is
+        # empty, instead of decoding the whole cover sheet up front.
+        pending, pending_row = (), 0
+        for row_num, row in iter_sheet_rows(zip_ref, sheet_file, read_sheets):
+            values = {}
+            for cell in row.iter(TAG_C):
+                match = CELL_REF_RE.match(cell.get("r"))
                 if match:
-                    below_ref = f"{match.group(1)}{int(match.group(2)) + 1}"
-                    if not cells.get(below_ref):
-                        return "Missing Confirm\n"
+                    values[match.group(1)] = parse_cell_value(cell, shared_strings)
+            if pending:
+                below = values if row_num == pending_row + 1 else {}
+                if not all(below.get(col) for col in pending):
+                    return "Missing Confirm\n"
+            pending = [col for col, val in values.items() if val == "確認"]
+            pending_row = row_num
+        if pending:
+            return "Missing Confirm\n"
     except Exception as e:
-        return f"Error in check_confirm_by: {e}"
+        return CheckFailure(f"Error in check_confirm_by: {e}")
     return None
 
 
 def check_status_in_test_items(
-    zip_ref, shared_strings, sheet_names, max_rows=1000, empty_limit=10
+    zip_ref,
+    shared_strings,
+    sheet_parts,
+    max_rows=1000,
+    empty_limit=10,
+    read_sheets=None,
 ):
     try:
-        if "テスト項目" not in sheet_names:
+        if "テスト項目" not in sheet_parts:
             return "Missing required sheet: 'テスト項目'"
 
-        idx = sheet_names.index("テスト項目") + 1
-        cells = extract_cells_from_sheet(
-            zip_ref, f"xl/worksheets/sheet{idx}.xml", shared_strings
-        )
-
-        confirm_col = next(
-            (
-                col_num_to_letter(col)
-                for row in [3, 4]
-                for col in range(50, 100)
-                if cells.get(f"{col_num_to_letter(col)}{row}") == "確認"
-            ),
-            None,
-        )
-
-        if not confirm_col:
-            return "Column '確認' not found"
-
+        # Only rows 3-4 (header) and columns B and '確認' of the following
+        # rows are read; the sheet is streamed and left as soon as the scan
+        # limits are reached.
+        headers = {}
+        confirm_col = None
         errors = []
         empty = 0
-        for row in range(5, max_rows + 1):
-            b_val = cells.get(f"B{row}")
-            if b_val and str(b_val).strip():
+        next_row = 5
+        for row_num, row in iter_sheet_rows(
+            zip_ref, sheet_parts["テスト項目"], read_sheets
+        ):
+            if row_num < 5:
+                if row_num in (3, 4):
+                    headers[row_num] = get_row_values(
+                        row, shared_strings, STATUS_HEADER_COLS
+                    )
+                continue
+
+            if confirm_col is None:
+                confirm_col = find_confirm_column(headers)
+                if not confirm_col:
+                    break
+            if row_num > max_rows:
+                break
+
+            # Rows missing from the sheet XML are empty
+            empty += row_num - next_row
+            if empty >= empty_limit:
+                break
+            next_row = row_num + 1
+
+            values = get_row_values(row, shared_strings, ("B", confirm_col))
+            b_val = values.get("B")
+            b_str = b_val.strip() if b_val else ""
+            if b_str:
                 empty = 0
-                status = cells.get(f"{confirm_col}{row}")
-                if not status or str(status).strip().upper() != "OK":
-                    errors.append(str(b_val).strip())
+                status = values.get(confirm_col)
+                if status == "OK":
+                    continue
+                if not status or status.strip().upper() != "OK":
+                    errors.append(b_str)
             else:
                 empty += 1
                 if empty >= empty_limit:
                     break
+
+        if not (confirm_col or find_confirm_column(headers)):
+            return "Column '確認' not found"
+
         return (
             f"{len(errors)} Status != 'OK': " + " + ".join(errors) + "\n"
             if errors
@@ -175,56 +504,118 @@ def check_status_in_test_items(
         )
 
     except Exception as e:
-        return f"Error in check_status_in_test_items: {e}"
+        return CheckFailure(f"Error in check_status_in_test_items: {e}")
     return None
 
 
-def check_invalid_text(cell_values, sheet_name, invalid_set):
-    for ref, val in cell_values.items():
-        if isinstance(val, str) and any(t in val for t in invalid_set):
+def contains_invalid_text(text, pattern, automaton=None):
+    if automaton is not None:
+        return next(automaton.iter(text), None) is not None
+    return pattern is not None and pattern.search(text) is not None
+
+
+def contains_vn_chars(text, delete_table):
+    # A string contains an invalid char iff deleting them changes its length
+    return len(text.translate(delete_table)) != len(text)
+
+
+def scan_shared_strings(shared_strings, predicate, *args):
+    # Test each distinct shared string once; the many cells referencing the
+    # same string are then answered with a dict lookup.
+    distinct = set(shared_strings)
+    # One pass over all of them joined rules out the common clean workbook;
+    # no configured text or char contains NUL, so nothing matches across it.
+    if not predicate("\0".join(distinct), *args):
+        return dict.fromkeys(distinct, False)
+    return {text: predicate(text, *args) for text in distinct}
+
+
+def get_flagged_indexes(shared_strings, known):
+    if not known or not any(known.values()):
+        return frozenset()
+    return frozenset(i for i, text in enumerate(shared_strings) if known[text])
+
+
+def check_invalid_text(cells, sheet_name, pattern, automaton=None, known=None):
+    known = known or {}
+    for ref, val in cells:
+        if not isinstance(val, str):
+            continue
+        found = known.get(val)
+        if found is None:
+            found = contains_invalid_text(val, pattern, automaton)
+        if found:
             return f"Invalid txt:{sheet_name}:Cell({ref}):{val}\n"
     return None
 
 
-def check_contains_vn_chars(cell_values, sheet_name, invalid_chars):
-    pattern = re.compile(f"[{''.join(re.escape(c) for c in invalid_chars)}]")
-    return (
-        "".join(
-            f"VieChar:{sheet_name}:Cell({ref}):{val}\n"
-            for ref, val in cell_values.items()
-            if isinstance(val, str) and pattern.search(val)
-        )
-        or None
-    )
+def check_contains_vn_chars(cell_values, sheet_name, delete_table, known=None):
+    known = known or {}
+    errors = []
+    for ref, val in cell_values.items():
+        if not isinstance(val, str):
+            continue
+        found = known.get(val)
+        if found is None:
+            found = contains_vn_chars(val, delete_table)
+        if found:
+            errors.append(f"VieChar:{sheet_name}:Cell({ref}):{val}\n")
+    return "".join(errors) or None
+
+
+def check_text_cells(
+    cell_values,
+    sheet_name,
+    pattern,
+    automaton,
+    delete_table,
+    known_invalid_text=None,
+    known_vn_chars=None,
+):
+    # check_invalid_text and check_contains_vn_chars in a single pass
+    known_invalid_text = known_invalid_text or {}
+    known_vn_chars = known_vn_chars or {}
+    invalid_text_err = None
+    vn_errors = []
+    for ref, val in cell_values.items():
+        if not isinstance(val, str):
+            continue
+        if invalid_text_err is None:
+            found = known_invalid_text.get(val)
+            if found is None:
+                found = contains_invalid_text(val, pattern, automaton)
+            if found:
+                invalid_text_err = f"Invalid txt:{sheet_name}:Cell({ref}):{val}\n"
+        found = known_vn_chars.get(val)
+        if found is None:
+            found = contains_vn_chars(val, delete_table)
+        if found:
+            vn_errors.append(f"VieChar:{sheet_name}:Cell({ref}):{val}\n")
+    return invalid_text_err, "".join(vn_errors) or None
 
 
 def check_sysdate_format(cell_values, sheet_name):
     errors = []
-    valid = re.compile(
-        r"(?:^|[^A-Za-z])SYSDATE\s*\(\s*\)(?:$|[^A-Za-z])", re.IGNORECASE
-    )
-    detect = re.compile(r"SYSDATE", re.IGNORECASE)
+    failed = False
+    start_col, end_col = SYSDATE_COLUMNS
 
     try:
         for ref, value in cell_values.items():
-            col = re.sub(r"\d", "", ref)
-            col_num = sum((ord(c) - 64) * (26**i) for i, c in enumerate(col[::-1]))
-            if (
-                CONFIG["sysdate_check_columns"]["start"]
-                <= col_num
-                <= CONFIG["sysdate_check_columns"]["end"]
-            ):
+            col_num = COL_NUMBERS.get(ref.rstrip("0123456789"), 0)
+            if start_col <= col_num <= end_col:
                 if (
                     isinstance(value, str)
-                    and detect.search(value)
-                    and not valid.search(value)
+                    and SYSDATE_DETECT_RE.search(value)
+                    and not SYSDATE_VALID_RE.search(value)
                 ):
                     errors.append(f" Cell({ref})")
     except Exception as e:
         errors.append(f"Error in {sheet_name}: {e}")
-    if errors:
-        errors = [f"SYSDATE: {sheet_name}: {', '.join(errors)}\n"]
-    return "".join(errors) if errors else None
+        failed = True
+    if not errors:
+        return None
+    message = f"SYSDATE: {sheet_name}: {', '.join(errors)}\n"
+    return CheckFailure(message) if failed else message
 
 
 def check_incorrect_textbox(zip_ref):
@@ -245,28 +636,38 @@ def check_incorrect_textbox(zip_ref):
 
 def check_valid_filename(file_path):
     filename = os.path.basename(file_path)
-    for folder, prefix in CATEGORY_PREFIX_MAP.items():
-        if folder in os.path.normpath(file_path).split(
-            os.sep
-        ) and not filename.startswith(prefix):
+    for folder, prefix in get_category_prefixes(os.path.dirname(file_path)):
+        if not filename.startswith(prefix):
             return f"Incorrect filename for '{folder}'\n"
     return None
 
 
 def check_excel_file_advanced(file_path, options, stop_event=None):
+    # Returns (status, message, completed); completed is False when the file
+    # could not be fully checked, so the verdict must not be cached.
     if stop_event and stop_event.is_set():
-        return "CANCELLED", "Stopped by user"
+        return "CANCELLED", "Stopped by user", False
 
     try:
         errors = []
         with zipfile.ZipFile(file_path, "r") as zip_ref:
-            shared_strings = get_shared_strings(zip_ref)
-            sheet_names = get_sheet_names(zip_ref)
-            sheet_files = [
-                f
-                for f in zip_ref.namelist()
-                if f.startswith("xl/worksheets/sheet") and f.endswith(".xml")
-            ]
+            sheet_parts = get_sheet_parts(zip_ref)
+            check_sheet_content = any(
+                options.get(key, True)
+                for key in (
+                    "check_invalid_text",
+                    "check_contains_vietnamese_characters",
+                    "check_sysdate_format",
+                )
+            )
+            # Shared strings are only needed by the checks that read cells
+            shared_strings = (
+                get_shared_strings(zip_ref)
+                if check_sheet_content
+                or options.get("check_confirm_cell", True)
+                or options.get("check_testcase_status", True)
+                else ()
+            )
 
             # ===== Check filename prefix =====
             if options.get("check_filename_prefix", True):
@@ -276,32 +677,107 @@ def check_excel_file_advanced(file_path, options, stop_event=None):
             # ===== Check invalid sheets =====
             if options.get("check_invalid_sheets", True):
                 for sheet in INVALID_SHEETS:
-                    if sheet in sheet_names:
+                    if sheet in sheet_parts:
                         errors.append(f"Contains invalid sheet: {sheet}")
 
             # ===== Check required sheets =====
             if options.get("check_required_sheets", True):
                 for sheet in REQUIRED_SHEETS:
-                    if sheet not in sheet_names:
+                    if sheet not in sheet_parts:
                         errors.append(f"Missing required sheet: {sheet}")
 
+            known_invalid_text = (
+                scan_shared_strings(
+                    shared_strings,
+                    contains_invalid_text,
+                    INVALID_TEXT_RE,
+                    INVALID_TEXT_AUTOMATON,
+                )
+                if options.get("check_invalid_text", True)
+                else None
+            )
+            known_vn_chars = (
+                scan_shared_strings(shared_strings, contains_vn_chars, VN_DELETE_TABLE)
+                if options.get("check_contains_vietnamese_characters", True)
+                else None
+            )
+
+            # Shared strings were tested once above, so a sheet only has to be
+            # scanned for text when it references one that matched or when it
+            # holds formula string results, which are stored inline.
+            invalid_text_refs = get_flagged_indexes(shared_strings, known_invalid_text)
+            vn_chars_refs = get_flagged_indexes(shared_strings, known_vn_chars)
+
+            # Cover and test item sheets read here are reused by the confirm
+            # and status checks below rather than decompressed again
+            read_sheets = {}
+
             # ===== Check per sheet content =====
-            for idx, sheet_file in enumerate(sheet_files):
-                if stop_event and stop_event.is_set():
-                    return "CANCELLED", "Stopped by user"
+            for sheet_name, sheet_file in sheet_parts.items():
+                if not check_sheet_content:
+                    break
 
-                cell_values = extract_cells_from_sheet(
-                    zip_ref, sheet_file, shared_strings
+                if stop_event and stop_event.is_set():
+                    return "CANCELLED", "Stopped by user", False
+
+                sheet_xml = zip_ref.read(sheet_file)
+                if sheet_name in ("表紙", "テスト項目"):
+                    read_sheets[sheet_file] = sheet_xml
+                has_formula_text = FORMULA_STRING_RE.search(sheet_xml) is not None
+                referenced = (
+                    {int(index) for index in set(CELL_VALUE_RE.findall(sheet_xml))}
+                    if invalid_text_refs or vn_chars_refs
+                    else set()
+                )
+                scan_invalid_text = options.get("check_invalid_text", True) and (
+                    has_formula_text or not invalid_text_refs.isdisjoint(referenced)
                 )
-                sheet_name = sheet_names[idx] if idx < len(sheet_names) else sheet_file
+                scan_vn_chars = options.get(
+                    "check_contains_vietnamese_characters", True
+                ) and (has_formula_text or not vn_chars_refs.isdisjoint(referenced))
+                if not (
+                    scan_invalid_text
+                    or scan_vn_chars
+                    or options.get("check_sysdate_format", True)
+                ):
+                    continue
 
-                if options.get("check_invalid_text", True):
-                    if err := check_invalid_text(cell_values, sheet_name, INVALID_TEXT):
+                if scan_vn_chars or options.get("check_sysdate_format", True):
+                    cell_values = extract_cells_from_sheet(sheet_xml, shared_strings)
+                    cells = cell_values.items()
+                else:
+                    # Invalid text stops at the first hit, so when it is the
+                    # only scan the rest of the sheet is never decoded.
+                    cells = iter_sheet_cells(sheet_xml, shared_strings)
+
+                if scan_invalid_text and scan_vn_chars:
+                    errors.extend(
+                        err
+                        for err in check_text_cells(
+                            cell_values,
+                            sheet_name,
+                            INVALID_TEXT_RE,
+                            INVALID_TEXT_AUTOMATON,
+                            VN_DELETE_TABLE,
+                            known_invalid_text,
+                            known_vn_chars,
+                        )
+                        if err
+                    )
+
+                elif scan_invalid_text:
+                    if err := check_invalid_text(
+                        cells,
+                        sheet_name,
+                        INVALID_TEXT_RE,
+                        INVALID_TEXT_AUTOMATON,
+                        known_invalid_text,
+                    ):
                         errors.append(err)
 
-                if options.get("check_contains_vietnamese_characters", True):
+                elif scan_vn_chars:
                     if err := check_contains_vn_chars(
-                        cell_values, sheet_name, INVALID_CHARS
+                        cell_values, sheet_name, VN_DELETE_TABLE, known_vn_chars
                     ):
                         errors.append(err)
 
@@ -310,12 +786,19 @@ def check_excel_file_advanced(file_path, options, stop_event=None):
                         errors.append(err)
 
             if options.get("check_confirm_cell", True):
-                if err := check_confirm_by(zip_ref, shared_strings, sheet_names):
+                if err := check_confirm_by(
+                    zip_ref, shared_strings, sheet_parts, read_sheets
+                ):
                     errors.append(err)
 
             if options.get("check_testcase_status", True):
                 if err := check_status_in_test_items(
-                    zip_ref, shared_strings, sheet_names
+                    zip_ref,
+                    shared_strings,
+                    sheet_parts,
+                    SCAN_LIMITS["max_rows"],
+                    SCAN_LIMITS["empty_limit"],
+                    read_sheets=read_sheets,
                 ):
                     errors.append(err)
 
@@ -323,10 +806,17 @@ def check_excel_file_advanced(file_path, options, stop_event=None):
                 if err := check_incorrect_textbox(zip_ref):
                     errors.append(err)
 
-        return ("ERROR", "".join(errors)) if errors else ("OK", "")
+        if not errors:
+            return "OK", "", True
+        completed = not any(isinstance(err, CheckFailure) for err in errors)
+        return "ERROR", "".join(errors), completed
 
     except Exception as e:
-        return "ERROR", f"Unhandled error in {os.path.basename(file_path)}: {str(e)}"
+        return (
+            "ERROR",
+            f"Unhandled error in {os.path.basename(file_path)}: {str(e)}",
+            False,
+        )
 
 
 # ==================== WORKER THREAD ====================
@@ -335,77 +825,228 @@ class ExcelCheckWorker(QThread):
     file_result = pyqtSignal(
         str, str, str, str
     )  # prefix_path, relative_path, status, error
+    scan_finished = pyqtSignal(int)  # total number of files found
     finished_signal = pyqtSignal()
 
-    def __init__(self, folder_path, options, max_workers=4):
+    def __init__(self, folder_path, options, max_workers=None):
         super().__init__()
         self.folder_path = folder_path
+        self.path_prefix = os.path.join(folder_path, "")
         self.options = options
-        self.max_workers = max_workers
+        # One worker per core; Windows process pools allow at most 61
+        self.max_workers = max_workers or min(os.cpu_count() or 4, 61)
         self._stop_event = Event()
+        # Set by the scanner thread once the walk is complete; progress reads
+        # the total from here, so it is determinate as soon as the walk ends
+        # rather than when the consumer finally drains the queue.
+        self._scan_done = Event()
+        self._scan_total = 0
 
     def run(self):
-        files = find_excel_files_recursive(self.folder_path)
-        total = len(files)
-        if not files:
-            self.file_result.emit(self.folder_path, "", "INFO", "No Excel files found.")
+        try:
+            self._check_files()
+        except Exception as e:
+            self.file_result.emit(
+                self.folder_path, "", "ERROR", f"Unhandled error: {e}"
+            )
+        finally:
             self.finished_signal.emit()
-            return
 
+    def _check_files(self):
+        # The scanner thread feeds the queue while files are being checked;
+        # None marks the end of the scan.
+        work_q = queue.Queue()
+        Thread(target=self._scan_files, args=(work_q,), daemon=True).start()
+
+        # Parsing is CPU bound, so files are checked in worker processes;
+        # tiny runs use threads to avoid the process start-up cost.
+        backlog = []
+        use_processes = self._fill_backlog(work_q, backlog)
+        if use_processes:
+            executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=init_worker_process,
+                initargs=(CONFIG,),
+            )
+        else:
+            executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        # A threading.Event cannot be sent to another process; pending
+        # futures are cancelled there instead.
+        stop_event = None if use_processes else self._stop_event
+
+        scan_exhausted = False
         processed = 0
-        chunk_size = 4  # Process files in chunks for better progress reporting
+        last_pct = -1
+        pending = {}
+        in_flight_limit = self.max_workers * 4
+        options_hash = hash_json(self.options)
+        # The filename check needs only the path, so when it is the only
+        # check enabled no file is opened and nothing goes to the executor.
+        filename_only = self.options.get("check_filename_prefix", True) and not any(
+            enabled
+            for key, enabled in self.options.items()
+            if key != "check_filename_prefix"
+        )
 
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            for i in range(0, total, chunk_size):
-                if self._stop_event.is_set():
-                    break
+        # The result cache only saves work: if it cannot be opened, or a
+        # lookup or store fails (locked or corrupt database), the run
+        # carries on without it.
+        try:
+            cache = open_result_cache()
+        except (OSError, sqlite3.Error):
+            cache = None
+
+        with closing(cache) if cache else nullcontext(), executor:
+            while not self._stop_event.is_set() and (not scan_exhausted or pending):
+                # Keep only a few files per worker in flight; the rest wait
+                # in the scan queue until a slot frees up.
+                while not scan_exhausted and len(pending) < in_flight_limit:
+                    try:
+                        file_path = (
+                            backlog.pop(0)
+                            if backlog
+                            else work_q.get(block=not pending, timeout=0.1)
+                        )
+                    except queue.Empty:
+                        break
+                    if file_path is None:
+                        scan_exhausted = True
+                        break
 
-                current_chunk = files[i : i + chunk_size]
-                chunk_futures = {
-                    executor.submit(
+                    if filename_only:
+                        err = check_valid_filename(file_path)
+                        self._emit_result(
+                            file_path, *(("ERROR", err) if err else ("OK", ""))
+                        )
+                        processed += 1
+                        last_pct = self._report_progress(processed, last_pct)
+                        continue
+
+                    cache_key = cache and get_cache_key(file_path, options_hash)
+                    cached = None
+                    if cache_key:
+                        try:
+                            cached = get_cached_result(cache, cache_key)
+                        except sqlite3.Error:
+                            cache = None
+                    if cached:
+                        self._emit_result(file_path, *cached)
+                        processed += 1
+                        last_pct = self._report_progress(processed, last_pct)
+                        continue
+
+                    future = executor.submit(
                         check_excel_file_advanced,
-                        file,
+                        file_path,
                         self.options,
-                        self._stop_event,
-                    ): file
-                    for file in current_chunk
-                }
+                        stop_event,
+                    )
+                    pending[future] = (file_path, cache_key)
 
-                for future in as_completed(chunk_futures):
-                    if self._stop_event.is_set():
-                        break
+                if not pending:
+                    continue
 
-                    file_path = chunk_futures[future]
+                done, _ = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+                for future in done:
+                    file_path, cache_key = pending.pop(future)
                     try:
-                        relative_path = os.path.relpath(file_path, self.folder_path)
-                        status, error_msg = future.result()
-                        self.file_result.emit(
-                            self.folder_path, relative_path, status, error_msg
-                        )
+                        status, error_msg, completed = future.result()
                     except Exception as e:
-                        self.file_result.emit(
-                            self.folder_path,
-                            os.path.relpath(file_path, self.folder_path),
-                            "ERROR",
-                            str(e),
-                        )
+                        status, error_msg = "ERROR", str(e)
+                    else:
+                        if cache and cache_key and completed:
+                            try:
+                                store_cached_result(
+                                    cache, cache_key, file_path, status, error_msg
+                                )
+                            except sqlite3.Error:
+                                cache = None
+                    self._emit_result(file_path, status, error_msg)
 
                     processed += 1
-                    self.progress_changed.emit(int((processed / total) * 100))
+                    last_pct = self._report_progress(processed, last_pct)
+
+            # The walk may end after the last file was handled
+            last_pct = self._report_progress(processed, last_pct)
+            # Drop everything not yet started; running files finish first
+            executor.shutdown(cancel_futures=True)
 
-        self.finished_signal.emit()
+        if self._scan_done.is_set() and self._scan_total == 0:
+            self.file_result.emit(self.folder_path, "", "INFO", "No Excel files found.")
+
+    def _fill_backlog(self, work_q, backlog):
+        # Wait until either enough files are found to be worth a process
+        # pool or the scan ends; returns True to use processes.
+        while len(backlog) < PROCESS_POOL_MIN_FILES:
+            if self._stop_event.is_set():
+                return False
+            try:
+                file_path = work_q.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            backlog.append(file_path)
+            if file_path is None:
+                return False
+        return True
+
+    def _report_progress(self, processed, last_pct):
+        # Only cross into the GUI thread when the percentage actually moves
+        if not (self._scan_done.is_set() and self._scan_total):
+            return last_pct
+        pct = processed * 100 // self._scan_total
+        if pct != last_pct:
+            self.progress_changed.emit(pct)
+        return pct
+
+    def _emit_result(self, file_path, status, error_msg):
+        # Scanned paths are built by joining onto folder_path, so slicing
+        # the prefix off avoids normalising both paths in relpath per file.
+        if file_path.startswith(self.path_prefix):
+            relative_path = file_path[len(self.path_prefix) :]
+        else:
+            relative_path = os.path.relpath(file_path, self.folder_path)
+        self.file_result.emit(self.folder_path, relative_path, status, error_msg)
+
+    def _scan_files(self, work_q):
+        count = 0
+        try:
+            for file_path in iter_excel_files(self.folder_path):
+                if self._stop_event.is_set():
+                    return
+                work_q.put(file_path)
+                count += 1
+        except Exception as e:
+            # Files found before the error are still checked
+            self.file_result.emit(
+                self.folder_path, "", "ERROR", f"Error while scanning: {e}"
+            )
+        finally:
+            if not self._stop_event.is_set():
+                self._scan_total = count
+                # Emitted before the event is set so the GUI leaves the busy
+                # state before any determinate progress arrives
+                self.scan_finished.emit(count)
+                self._scan_done.set()
+            # The consumer waits for this sentinel, so it is always sent
+            work_q.put(None)
 
     def stop(self):
         self._stop_event.set()
 
 
 # ==================== MAIN WINDOW ====================
+STATUS_COLORS = {"OK": QColor("green"), "ERROR": QColor("red")}
+
+
 class MainWindow(QWidget):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Excel Checker v1.3.3")
         self.setGeometry(100, 100, 1000, 600)
         self.worker = None
+        self.error_count = 0
+        self.row_buffer = []
+        self.flush_scheduled = False
         self.init_ui()
 
     def init_ui(self):
@@ -417,6 +1058,13 @@ class MainWindow(QWidget):
         self.folder_input.setPlaceholderText("Paste or type folder path here...")
         self.folder_input.textChanged.connect(self.on_folder_input_change)
 
+        # The folder is checked once typing pauses, not on every keystroke;
+        # isdir on a network path can block the UI for a while.
+        self.folder_check_timer = QTimer(self)
+        self.folder_check_timer.setSingleShot(True)
+        self.folder_check_timer.setInterval(250)
+        self.folder_check_timer.timeout.connect(self.check_folder_input)
+
         self.btn_select = QPushButton("Browse")
         self.btn_select.clicked.connect(self.select_folder)
 
@@ -546,7 +1194,10 @@ class MainWindow(QWidget):
         self.sysdate_check_cb.setChecked(False)
 
     def on_folder_input_change(self, text):
-        self.btn_execute.setEnabled(os.path.isdir(text.strip()))
+        self.folder_check_timer.start()
+
+    def check_folder_input(self):
+        self.btn_execute.setEnabled(os.path.isdir(self.folder_input.text().strip()))
 
     def select_folder(self):
         current_path = self.folder_input.text().strip()
@@ -566,8 +1217,10 @@ class MainWindow(QWidget):
             )
             return
 
-        self.progress_bar.setValue(0)
+        self.progress_bar.setRange(0, 0)
         self.table.setRowCount(0)
+        self.row_buffer.clear()
+        self.error_count = 0
         self.btn_execute.setEnabled(False)
         self.btn_stop.setEnabled(True)
         self.status_label.setText("Processing...")
@@ -585,10 +1238,11 @@ class MainWindow(QWidget):
             "check_sysdate_format": self.sysdate_check_cb.isChecked(),
         }
 
-        load_config()
+        reload_config_if_changed()
         self.worker = ExcelCheckWorker(folder_path, options)
         self.worker.progress_changed.connect(self.progress_bar.setValue)
-        self.worker.file_result.connect(self.add_table_row)
+        self.worker.scan_finished.connect(self.on_scan_finished)
+        self.worker.file_result.connect(self.queue_table_row)
         self.worker.finished_signal.connect(self.on_finished)
         self.worker.start()
 
@@ -598,6 +1252,7 @@ class MainWindow(QWidget):
             self.btn_stop.setEnabled(False)
             self.btn_execute.setEnabled(False)
             self.btn_export.setEnabled(False)
+            self.progress_bar.setRange(0, 100)
             self.progress_bar.setValue(0)
             self.status_label.setText("Process stopped by user... ")
             self.table.setSortingEnabled(False)
@@ -606,26 +1261,47 @@ class MainWindow(QWidget):
             self.btn_stop.setText("Stop")
             self.btn_execute.setEnabled(True)
 
-    def add_table_row(self, prefix_path, path, status, error):
-        row = self.table.rowCount()
-        self.table.insertRow(row)
+    def queue_table_row(self, prefix_path, path, status, error):
+        # Rows are inserted in batches so the table lays out once per flush
+        # rather than once per file.
+        self.row_buffer.append((prefix_path, path, status, error))
+        if not self.flush_scheduled:
+            self.flush_scheduled = True
+            QTimer.singleShot(50, self.flush_table_rows)
+
+    def flush_table_rows(self):
+        self.flush_scheduled = False
+        if not self.row_buffer:
+            return
 
-        items = [
-            QTableWidgetItem(prefix_path.replace("/", "\\")),
-            QTableWidgetItem(path),
-            QTableWidgetItem(status),
-            QTableWidgetItem(error),
-        ]
+        sorting_enabled = self.table.isSortingEnabled()
+        self.table.setSortingEnabled(False)
+        self.table.setUpdatesEnabled(False)
+
+        first_row = row = self.table.rowCount()
+        self.table.setRowCount(row + len(self.row_buffer))
+        for prefix_path, path, status, error in self.row_buffer:
+            items = [
+                QTableWidgetItem(prefix_path.replace("/", "\\")),
+                QTableWidgetItem(path),
+                QTableWidgetItem(status),
+                QTableWidgetItem(error),
+            ]
 
-        if status == "OK":
-            items[2].setForeground(QColor("green"))
-        elif status == "ERROR":
-            items[2].setForeground(QColor("red"))
+            if status in STATUS_COLORS:
+                items[2].setForeground(STATUS_COLORS[status])
+            if status == "ERROR":
+                self.error_count += 1
 
-        for col, item in enumerate(items):
-            self.table.setItem(row, col, item)
+            for col, item in enumerate(items):
+                self.table.setItem(row, col, item)
+            row += 1
+        self.row_buffer.clear()
 
-        if row == 0:
+        self.table.setUpdatesEnabled(True)
+        self.table.setSortingEnabled(sorting_enabled)
+
+        if first_row == 0:
             self.btn_export.setEnabled(True)
 
     def open_selected_file(self, item):
@@ -657,7 +1333,12 @@ class MainWindow(QWidget):
         else:
             QMessageBox.warning(self, "File Not Found", f"File not found: {path}")
 
+    def on_scan_finished(self, total):
+        self.progress_bar.setRange(0, 100)
+
     def on_finished(self):
+        self.flush_table_rows()
+        self.progress_bar.setRange(0, 100)
         self.btn_execute.setEnabled(True)
         self.btn_stop.setEnabled(False)
         self.table.setSortingEnabled(True)
@@ -668,13 +1349,8 @@ class MainWindow(QWidget):
             QMessageBox.information(self, "Stopped", "Process was stopped by user.")
         else:
             total_files = self.table.rowCount()
-            error_count = sum(
-                1
-                for row in range(total_files)
-                if self.table.item(row, 2).text() == "ERROR"
-            )
-            ok_count = total_files - error_count
-            summary = f"Check completed.\nTotal files: {total_files}\nOK: {ok_count}\nErrors: {error_count}"
+            ok_count = total_files - self.error_count
+            summary = f"Check completed.\nTotal files: {total_files}\nOK: {ok_count}\nErrors: {self.error_count}"
             self.status_label.setText("Process completed")
             QMessageBox.information(self, "Done", summary)
 
@@ -702,34 +1378,44 @@ class MainWindow(QWidget):
             file_path += ".xlsx"
 
         try:
-            wb = Workbook()
-            ws = wb.active
-            ws.title = "Check Results"
+            # openpyxl is only used here; importing it on demand keeps it out
+            # of start-up and of every worker process the checker spawns.
+            from openpyxl import Workbook
+            from openpyxl.cell import WriteOnlyCell
+            from openpyxl.styles import Font, Alignment
+
+            # Rows are streamed to disk as they are appended, so column widths
+            # are measured from the table first and set before any row.
+            wb = Workbook(write_only=True)
+            ws = wb.create_sheet("Check Results")
 
             headers = ["Prefix Path", "Relative Path", "Status", "Errors"]
-            for col, header in enumerate(headers, 1):
-                cell = ws.cell(row=1, column=col, value=header)
+            row_count = self.table.rowCount()
+            column_count = self.table.columnCount()
+            widths = [len(header) for header in headers]
+            for row in range(row_count):
+                for col in range(column_count):
+                    item = self.table.item(row, col)
+                    if item and len(item.text()) > widths[col]:
+                        widths[col] = len(item.text())
+            for col, width in enumerate(widths, 1):
+                ws.column_dimensions[col_num_to_letter(col)].width = (width + 2) * 1.2
+
+            header_cells = []
+            for header in headers:
+                cell = WriteOnlyCell(ws, value=header)
                 cell.font = Font(bold=True)
                 cell.alignment = Alignment(horizontal="center")
-
-            for row in range(self.table.rowCount()):
-                for col in range(self.table.columnCount()):
-                    item = self.table.item(row, col)
-                    ws.cell(
-                        row=row + 2, column=col + 1, value=item.text() if item else ""
-                    )
-
-            for column in ws.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                adjusted_width = (max_length + 2) * 1.2
-                ws.column_dimensions[column_letter].width = adjusted_width
+                header_cells.append(cell)
+            ws.append(header_cells)
+
+            for row in range(row_count):
+                ws.append(
+                    [
+                        item.text() if (item := self.table.item(row, col)) else ""
+                        for col in range(column_count)
+                    ]
+                )
 
             wb.save(file_path)
             QMessageBox.information(
@@ -743,6 +1429,7 @@ class MainWindow(QWidget):
 
 
 if __name__ == "__main__":
+    freeze_support()
     app = QApplication(sys.argv)
     window = MainWindow()
     window.show()